@@ -13,18 +13,31 @@ License: Educational/Research Use Only
 
 WARNING: This tool is for authorized security testing only.
 Use responsibly and in accordance with applicable laws and regulations.
+
+Performance notes: query generation is bound by interpreter string, dict
+and object allocation work. Speedups come from the precomputed template
+arrays and string concatenation, not from JIT compilation. Do not add
+numba.njit here: f-strings, dataclasses and Enum are not supported in
+nopython mode, and per-call dispatch overhead exceeds the work done per
+query.
 """
 
 import random
-import string
-import json
-import time
-import argparse
 import sys
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
 from dataclasses import dataclass
 from enum import Enum
-import urllib.parse
+
+# Characters urllib.parse.quote leaves unescaped with its default safe="/"
+_QUOTE_SAFE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/")
+_QUOTE_TABLE = {c: f"%{c:02X}" for c in range(128) if chr(c) not in _QUOTE_SAFE}
+
+def _quote(text: str) -> str:
+    """URL-encode text like urllib.parse.quote, translating ASCII input in one pass"""
+    if text.isascii():
+        return text.translate(_QUOTE_TABLE)
+    from urllib.parse import quote
+    return quote(text)
 
 class DorkCategory(Enum):
     """Categories of Google Dorks"""
@@ -42,7 +55,13 @@ class DorkCategory(Enum):
     SHOPPING_INFO = "shopping_info"
     PASSWORD_INFO = "password_info"
 
-@dataclass
+# Every category in definition order, built once
+_ALL_CATEGORIES: Tuple[DorkCategory, ...] = tuple(DorkCategory)
+
+# Upper-case display labels for each category
+_CAT_UPPER: Dict[DorkCategory, str] = {c: c.value.upper() for c in _ALL_CATEGORIES}
+
+@dataclass(slots=True, frozen=True)
 class DorkQuery:
     """Represents a Google Dork query with metadata"""
     query: str
@@ -52,448 +71,506 @@ class DorkQuery:
     use_case: str
     example_target: str = ""
 
+# Dork templates, built once at import and shared by every GoogleDorker
+_DORK_TEMPLATES: Dict[DorkCategory, Tuple[Dict, ...]] = {
+    DorkCategory.FILE_DISCOVERY: (
+        {
+            "template": "filetype:{ext} {target}",
+            "extensions": ("pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "txt", "csv"),
+            "description": "Find specific file types on target domain",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} filetype:{ext}",
+            "extensions": ("pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx"),
+            "description": "Discover documents on target website",
+            "risk": "Medium"
+        }
+    ),
+    
+    DorkCategory.DIRECTORY_LISTING: (
+        {
+            "template": "site:{target} intitle:index.of",
+            "description": "Find directory listings on target",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"index of\"",
+            "description": "Alternative directory listing search",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} inurl:admin intitle:index.of",
+            "description": "Find admin directory listings",
+            "risk": "Critical"
+        }
+    ),
+    
+    DorkCategory.VULNERABILITY_SCANNING: (
+        {
+            "template": "site:{target} inurl:phpmyadmin",
+            "description": "Find phpMyAdmin installations",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} inurl:wp-admin",
+            "description": "Find WordPress admin panels",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"SQL syntax near\"",
+            "description": "Find SQL error messages",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"mysql_fetch_array()\"",
+            "description": "Find MySQL error messages",
+            "risk": "High"
+        }
+    ),
+    
+    DorkCategory.INFORMATION_DISCLOSURE: (
+        {
+            "template": "site:{target} \"password\" filetype:txt",
+            "description": "Find password files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"username\" filetype:txt",
+            "description": "Find username files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"config\" filetype:txt",
+            "description": "Find configuration files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"database\" filetype:sql",
+            "description": "Find database files",
+            "risk": "Critical"
+        }
+    ),
+    
+    DorkCategory.TECHNOLOGY_DETECTION: (
+        {
+            "template": "site:{target} \"powered by\"",
+            "description": "Identify web technologies",
+            "risk": "Low"
+        },
+        {
+            "template": "site:{target} \"server: apache\"",
+            "description": "Identify Apache servers",
+            "risk": "Low"
+        },
+        {
+            "template": "site:{target} \"x-powered-by\"",
+            "description": "Find server headers",
+            "risk": "Low"
+        }
+    ),
+    
+    DorkCategory.ADMIN_PANELS: (
+        {
+            "template": "site:{target} inurl:admin",
+            "description": "Find admin panels",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} inurl:login",
+            "description": "Find login pages",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} inurl:panel",
+            "description": "Find control panels",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} inurl:manage",
+            "description": "Find management interfaces",
+            "risk": "High"
+        }
+    ),
+    
+    DorkCategory.SENSITIVE_FILES: (
+        {
+            "template": "site:{target} filetype:bak",
+            "description": "Find backup files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} filetype:old",
+            "description": "Find old files",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} filetype:tmp",
+            "description": "Find temporary files",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} \"robots.txt\"",
+            "description": "Find robots.txt files",
+            "risk": "Low"
+        }
+    ),
+    
+    DorkCategory.DATABASE_DUMPS: (
+        {
+            "template": "site:{target} filetype:sql",
+            "description": "Find SQL database dumps",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"dump\" filetype:sql",
+            "description": "Find database dumps",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"backup\" filetype:sql",
+            "description": "Find SQL backups",
+            "risk": "Critical"
+        }
+    ),
+    
+    DorkCategory.BACKUP_FILES: (
+        {
+            "template": "site:{target} filetype:zip",
+            "description": "Find ZIP archives",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} filetype:rar",
+            "description": "Find RAR archives",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} filetype:tar.gz",
+            "description": "Find compressed archives",
+            "risk": "High"
+        }
+    ),
+    
+    DorkCategory.LOG_FILES: (
+        {
+            "template": "site:{target} filetype:log",
+            "description": "Find log files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"access.log\"",
+            "description": "Find access logs",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"error.log\"",
+            "description": "Find error logs",
+            "risk": "High"
+        }
+    ),
+    
+    DorkCategory.IOT_DEVICES: (
+        {
+            "template": "site:{target} inurl:8080",
+            "description": "Find devices on port 8080",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} inurl:8081",
+            "description": "Find devices on port 8081",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"camera\" OR \"webcam\"",
+            "description": "Find camera devices",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"router\" OR \"gateway\"",
+            "description": "Find router/gateway devices",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"printer\" OR \"scanner\"",
+            "description": "Find printer/scanner devices",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"nas\" OR \"storage\"",
+            "description": "Find NAS/storage devices",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"iot\" OR \"smart device\"",
+            "description": "Find IoT/smart devices",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"sensor\" OR \"monitor\"",
+            "description": "Find sensor/monitoring devices",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"thermostat\" OR \"climate\"",
+            "description": "Find climate control devices",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} \"security\" OR \"alarm\"",
+            "description": "Find security/alarm systems",
+            "risk": "Critical"
+        }
+    ),
+    
+    DorkCategory.SHOPPING_INFO: (
+        {
+            "template": "site:{target} \"price\" OR \"cost\"",
+            "description": "Find pricing information",
+            "risk": "Low"
+        },
+        {
+            "template": "site:{target} \"inventory\" OR \"stock\"",
+            "description": "Find inventory information",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} \"discount\" OR \"sale\"",
+            "description": "Find discount/sale information",
+            "risk": "Low"
+        },
+        {
+            "template": "site:{target} \"cart\" OR \"checkout\"",
+            "description": "Find shopping cart/checkout pages",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} \"product\" filetype:csv",
+            "description": "Find product CSV files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"customer\" OR \"buyer\"",
+            "description": "Find customer information",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"order\" OR \"purchase\"",
+            "description": "Find order/purchase information",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"payment\" OR \"billing\"",
+            "description": "Find payment/billing information",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"shipping\" OR \"delivery\"",
+            "description": "Find shipping/delivery information",
+            "risk": "Medium"
+        },
+        {
+            "template": "site:{target} \"review\" OR \"rating\"",
+            "description": "Find review/rating information",
+            "risk": "Low"
+        }
+    ),
+    
+    DorkCategory.PASSWORD_INFO: (
+        {
+            "template": "site:{target} \"password\" filetype:txt",
+            "description": "Find password text files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"password\" filetype:doc",
+            "description": "Find password documents",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"password\" filetype:pdf",
+            "description": "Find password PDF files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"passwd\" OR \"shadow\"",
+            "description": "Find system password files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"credentials\" OR \"auth\"",
+            "description": "Find credential/authentication files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"secret\" OR \"key\"",
+            "description": "Find secret/key files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"token\" OR \"api_key\"",
+            "description": "Find token/API key files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"login\" filetype:txt",
+            "description": "Find login information files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"user\" filetype:txt",
+            "description": "Find user information files",
+            "risk": "High"
+        },
+        {
+            "template": "site:{target} \"config\" filetype:txt",
+            "description": "Find configuration files with passwords",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \"database\" filetype:txt",
+            "description": "Find database configuration files",
+            "risk": "Critical"
+        },
+        {
+            "template": "site:{target} \".env\" OR \"environment\"",
+            "description": "Find environment variable files",
+            "risk": "Critical"
+        }
+    )
+}
+
+# Ethical usage warnings
+_ETHICAL_WARNINGS: Tuple[str, ...] = (
+    "WARNING: This tool is for authorized security testing only!",
+    "WARNING: Only use on systems you own or have explicit permission to test.",
+    "WARNING: Unauthorized access to computer systems is illegal in most jurisdictions.",
+    "WARNING: Use responsibly and in accordance with applicable laws and regulations.",
+    "WARNING: The authors are not responsible for misuse of this tool.",
+    "WARNING: Always obtain proper authorization before conducting security assessments."
+)
+
+# Canonical risk level strings shared by every template row
+_RISK = {level: sys.intern(level) for level in ("Low", "Medium", "High", "Critical")}
+
+def _split_template(template: str, ext: str = None) -> Tuple[str, str]:
+    """Pre-evaluate a template into the (prefix, suffix) around {target}"""
+    if ext is not None:
+        template = template.replace("{ext}", ext)
+    prefix, suffix = template.split("{target}")
+    return prefix, suffix
+
+def _build_template_arrays(templates: Dict[DorkCategory, Tuple[Dict, ...]]) -> Tuple[Tuple, ...]:
+    """Flatten the template catalog into parallel tuples, one row per generated query"""
+    prefixes, suffixes, descs, risks, cats, exts = [], [], [], [], [], []
+    
+    for cat in _ALL_CATEGORIES:
+        for template_data in templates[cat]:
+            if "extensions" in template_data:
+                # One row per extension, limited to 2 per template
+                for ext in template_data["extensions"][:2]:
+                    prefix, suffix = _split_template(template_data["template"], ext)
+                    prefixes.append(prefix)
+                    suffixes.append(suffix)
+                    descs.append(f"{template_data['description']} ({ext} files)")
+                    risks.append(_RISK[template_data["risk"]])
+                    cats.append(cat)
+                    exts.append(ext)
+            else:
+                prefix, suffix = _split_template(template_data["template"])
+                prefixes.append(prefix)
+                suffixes.append(suffix)
+                descs.append(template_data["description"])
+                risks.append(_RISK[template_data["risk"]])
+                cats.append(cat)
+                exts.append(None)
+    
+    return tuple(prefixes), tuple(suffixes), tuple(descs), tuple(risks), tuple(cats), tuple(exts)
+
+# The generator assumes every category has templates, so check it once here
+assert set(_DORK_TEMPLATES) == set(_ALL_CATEGORIES), "every DorkCategory needs templates"
+
+# Structure-of-arrays view of _DORK_TEMPLATES used by the query generator
+(_TPL_PREFIX, _TPL_SUFFIX, _TPL_DESC,
+ _TPL_RISK, _TPL_CAT, _TPL_EXT) = _build_template_arrays(_DORK_TEMPLATES)
+
+# Rows whose template starts with "site:{target}" share one per-call prefix
+_TPL_HAS_SITE = tuple(prefix == "site:" for prefix in _TPL_PREFIX)
+
+# File types combined with each keyword in advanced queries, with their query fragment
+_ADVANCED_EXT_FRAGMENTS: Tuple[Tuple[str, str], ...] = tuple(
+    (ext, " filetype:" + ext) for ext in ("txt", "pdf", "doc", "sql")
+)
+
+# Console layout of one query in display_queries
+_DISPLAY_TEMPLATE = (
+    "[{}] {}\n"
+    "Query: {}\n"
+    "Description: {}\n"
+    "Risk Level: {}\n"
+    "Use Case: {}\n"
+    "Google URL: https://www.google.com/search?q={}\n"
+    + "-" * 80
+)
+
+# Maximum number of queries returned by generate_advanced_queries
+_ADVANCED_QUERY_LIMIT = 15
+
 class GoogleDorker:
     """Main Google Dorker class with advanced query generation algorithms"""
     
     def __init__(self):
-        self.dork_templates = self._initialize_dork_templates()
-        self.ethical_warnings = self._get_ethical_warnings()
-        
-    def _initialize_dork_templates(self) -> Dict[DorkCategory, List[Dict]]:
-        """Initialize comprehensive dork templates"""
-        return {
-            DorkCategory.FILE_DISCOVERY: [
-                {
-                    "template": "filetype:{ext} {target}",
-                    "extensions": ["pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "txt", "csv"],
-                    "description": "Find specific file types on target domain",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} filetype:{ext}",
-                    "extensions": ["pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx"],
-                    "description": "Discover documents on target website",
-                    "risk": "Medium"
-                }
-            ],
-            
-            DorkCategory.DIRECTORY_LISTING: [
-                {
-                    "template": "site:{target} intitle:index.of",
-                    "description": "Find directory listings on target",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"index of\"",
-                    "description": "Alternative directory listing search",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} inurl:admin intitle:index.of",
-                    "description": "Find admin directory listings",
-                    "risk": "Critical"
-                }
-            ],
-            
-            DorkCategory.VULNERABILITY_SCANNING: [
-                {
-                    "template": "site:{target} inurl:phpmyadmin",
-                    "description": "Find phpMyAdmin installations",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} inurl:wp-admin",
-                    "description": "Find WordPress admin panels",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"SQL syntax near\"",
-                    "description": "Find SQL error messages",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"mysql_fetch_array()\"",
-                    "description": "Find MySQL error messages",
-                    "risk": "High"
-                }
-            ],
-            
-            DorkCategory.INFORMATION_DISCLOSURE: [
-                {
-                    "template": "site:{target} \"password\" filetype:txt",
-                    "description": "Find password files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"username\" filetype:txt",
-                    "description": "Find username files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"config\" filetype:txt",
-                    "description": "Find configuration files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"database\" filetype:sql",
-                    "description": "Find database files",
-                    "risk": "Critical"
-                }
-            ],
-            
-            DorkCategory.TECHNOLOGY_DETECTION: [
-                {
-                    "template": "site:{target} \"powered by\"",
-                    "description": "Identify web technologies",
-                    "risk": "Low"
-                },
-                {
-                    "template": "site:{target} \"server: apache\"",
-                    "description": "Identify Apache servers",
-                    "risk": "Low"
-                },
-                {
-                    "template": "site:{target} \"x-powered-by\"",
-                    "description": "Find server headers",
-                    "risk": "Low"
-                }
-            ],
-            
-            DorkCategory.ADMIN_PANELS: [
-                {
-                    "template": "site:{target} inurl:admin",
-                    "description": "Find admin panels",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} inurl:login",
-                    "description": "Find login pages",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} inurl:panel",
-                    "description": "Find control panels",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} inurl:manage",
-                    "description": "Find management interfaces",
-                    "risk": "High"
-                }
-            ],
-            
-            DorkCategory.SENSITIVE_FILES: [
-                {
-                    "template": "site:{target} filetype:bak",
-                    "description": "Find backup files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} filetype:old",
-                    "description": "Find old files",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} filetype:tmp",
-                    "description": "Find temporary files",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} \"robots.txt\"",
-                    "description": "Find robots.txt files",
-                    "risk": "Low"
-                }
-            ],
-            
-            DorkCategory.DATABASE_DUMPS: [
-                {
-                    "template": "site:{target} filetype:sql",
-                    "description": "Find SQL database dumps",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"dump\" filetype:sql",
-                    "description": "Find database dumps",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"backup\" filetype:sql",
-                    "description": "Find SQL backups",
-                    "risk": "Critical"
-                }
-            ],
-            
-            DorkCategory.BACKUP_FILES: [
-                {
-                    "template": "site:{target} filetype:zip",
-                    "description": "Find ZIP archives",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} filetype:rar",
-                    "description": "Find RAR archives",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} filetype:tar.gz",
-                    "description": "Find compressed archives",
-                    "risk": "High"
-                }
-            ],
-            
-            DorkCategory.LOG_FILES: [
-                {
-                    "template": "site:{target} filetype:log",
-                    "description": "Find log files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"access.log\"",
-                    "description": "Find access logs",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"error.log\"",
-                    "description": "Find error logs",
-                    "risk": "High"
-                }
-            ],
-            
-            DorkCategory.IOT_DEVICES: [
-                {
-                    "template": "site:{target} inurl:8080",
-                    "description": "Find devices on port 8080",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} inurl:8081",
-                    "description": "Find devices on port 8081",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"camera\" OR \"webcam\"",
-                    "description": "Find camera devices",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"router\" OR \"gateway\"",
-                    "description": "Find router/gateway devices",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"printer\" OR \"scanner\"",
-                    "description": "Find printer/scanner devices",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"nas\" OR \"storage\"",
-                    "description": "Find NAS/storage devices",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"iot\" OR \"smart device\"",
-                    "description": "Find IoT/smart devices",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"sensor\" OR \"monitor\"",
-                    "description": "Find sensor/monitoring devices",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"thermostat\" OR \"climate\"",
-                    "description": "Find climate control devices",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} \"security\" OR \"alarm\"",
-                    "description": "Find security/alarm systems",
-                    "risk": "Critical"
-                }
-            ],
-            
-            DorkCategory.SHOPPING_INFO: [
-                {
-                    "template": "site:{target} \"price\" OR \"cost\"",
-                    "description": "Find pricing information",
-                    "risk": "Low"
-                },
-                {
-                    "template": "site:{target} \"inventory\" OR \"stock\"",
-                    "description": "Find inventory information",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} \"discount\" OR \"sale\"",
-                    "description": "Find discount/sale information",
-                    "risk": "Low"
-                },
-                {
-                    "template": "site:{target} \"cart\" OR \"checkout\"",
-                    "description": "Find shopping cart/checkout pages",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} \"product\" filetype:csv",
-                    "description": "Find product CSV files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"customer\" OR \"buyer\"",
-                    "description": "Find customer information",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"order\" OR \"purchase\"",
-                    "description": "Find order/purchase information",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"payment\" OR \"billing\"",
-                    "description": "Find payment/billing information",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"shipping\" OR \"delivery\"",
-                    "description": "Find shipping/delivery information",
-                    "risk": "Medium"
-                },
-                {
-                    "template": "site:{target} \"review\" OR \"rating\"",
-                    "description": "Find review/rating information",
-                    "risk": "Low"
-                }
-            ],
-            
-            DorkCategory.PASSWORD_INFO: [
-                {
-                    "template": "site:{target} \"password\" filetype:txt",
-                    "description": "Find password text files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"password\" filetype:doc",
-                    "description": "Find password documents",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"password\" filetype:pdf",
-                    "description": "Find password PDF files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"passwd\" OR \"shadow\"",
-                    "description": "Find system password files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"credentials\" OR \"auth\"",
-                    "description": "Find credential/authentication files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"secret\" OR \"key\"",
-                    "description": "Find secret/key files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"token\" OR \"api_key\"",
-                    "description": "Find token/API key files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"login\" filetype:txt",
-                    "description": "Find login information files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"user\" filetype:txt",
-                    "description": "Find user information files",
-                    "risk": "High"
-                },
-                {
-                    "template": "site:{target} \"config\" filetype:txt",
-                    "description": "Find configuration files with passwords",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \"database\" filetype:txt",
-                    "description": "Find database configuration files",
-                    "risk": "Critical"
-                },
-                {
-                    "template": "site:{target} \".env\" OR \"environment\"",
-                    "description": "Find environment variable files",
-                    "risk": "Critical"
-                }
-            ]
-        }
-    
-    def _get_ethical_warnings(self) -> List[str]:
-        """Get ethical usage warnings"""
-        return [
-            "WARNING: This tool is for authorized security testing only!",
-            "WARNING: Only use on systems you own or have explicit permission to test.",
-            "WARNING: Unauthorized access to computer systems is illegal in most jurisdictions.",
-            "WARNING: Use responsibly and in accordance with applicable laws and regulations.",
-            "WARNING: The authors are not responsible for misuse of this tool.",
-            "WARNING: Always obtain proper authorization before conducting security assessments."
-        ]
+        self.dork_templates = _DORK_TEMPLATES
+        self.ethical_warnings = _ETHICAL_WARNINGS
     
     def generate_dork_queries(self, target: str, category: DorkCategory = None, 
-                            count: int = 10) -> List[DorkQuery]:
-        """Generate Google Dork queries for a target"""
-        queries = []
-        
-        if category:
-            categories = [category]
+                            count: int = 10) -> Iterator[DorkQuery]:
+        """Generate Google Dork queries for a target, yielding up to count of them"""
+        if category is None:
+            rows = range(len(_TPL_PREFIX))
         else:
-            categories = list(DorkCategory)
+            rows = [i for i in range(len(_TPL_PREFIX)) if _TPL_CAT[i] is category]
         
-        for cat in categories:
-            if cat in self.dork_templates:
-                for template_data in self.dork_templates[cat]:
-                    if "extensions" in template_data:
-                        # Handle templates with multiple extensions
-                        for ext in template_data["extensions"][:2]:  # Limit to 2 per template
-                            query_str = template_data["template"].format(
-                                target=target, ext=ext
-                            )
-                            queries.append(DorkQuery(
-                                query=query_str,
-                                category=cat,
-                                description=f"{template_data['description']} ({ext} files)",
-                                risk_level=template_data["risk"],
-                                use_case=f"Find {ext} files on {target}",
-                                example_target=target
-                            ))
-                    else:
-                        # Handle simple templates
-                        query_str = template_data["template"].format(target=target)
-                        queries.append(DorkQuery(
-                            query=query_str,
-                            category=cat,
-                            description=template_data["description"],
-                            risk_level=template_data["risk"],
-                            use_case=f"Security assessment of {target}",
-                            example_target=target
-                        ))
+        site_prefix = "site:" + target
         
-        # Shuffle and limit results
-        random.shuffle(queries)
-        return queries[:count]
+        # Pick the rows first so only the kept queries are constructed
+        for i in random.sample(rows, max(0, min(count, len(rows)))):
+            if _TPL_HAS_SITE[i]:
+                query_str = site_prefix + _TPL_SUFFIX[i]
+            else:
+                query_str = _TPL_PREFIX[i] + target + _TPL_SUFFIX[i]
+            
+            ext = _TPL_EXT[i]
+            if ext is not None:
+                use_case = f"Find {ext} files on {target}"
+            else:
+                use_case = f"Security assessment of {target}"
+            
+            yield DorkQuery(
+                query=query_str,
+                category=_TPL_CAT[i],
+                description=_TPL_DESC[i],
+                risk_level=_TPL_RISK[i],
+                use_case=use_case,
+                example_target=target
+            )
     
     def generate_advanced_queries(self, target: str, keywords: List[str] = None) -> List[DorkQuery]:
         """Generate advanced dork queries with custom keywords"""
         if not keywords:
             keywords = ["admin", "login", "config", "password", "database", "backup"]
         
+        # Only take as many keywords as can contribute to the capped result
+        per_keyword = 1 + len(_ADVANCED_EXT_FRAGMENTS)
+        keywords = keywords[:(_ADVANCED_QUERY_LIMIT + per_keyword - 1) // per_keyword]
+        
         advanced_queries = []
+        site_prefix = f"site:{target} "
         
         # Combine target with keywords
         for keyword in keywords:
             # Basic keyword search
-            query = f"site:{target} {keyword}"
+            query = site_prefix + keyword
             advanced_queries.append(DorkQuery(
                 query=query,
                 category=DorkCategory.INFORMATION_DISCLOSURE,
@@ -504,10 +581,9 @@ class GoogleDorker:
             ))
             
             # File type combinations
-            for ext in ["txt", "pdf", "doc", "sql"]:
-                query = f"site:{target} {keyword} filetype:{ext}"
+            for ext, fragment in _ADVANCED_EXT_FRAGMENTS:
                 advanced_queries.append(DorkQuery(
-                    query=query,
+                    query=query + fragment,
                     category=DorkCategory.FILE_DISCOVERY,
                     description=f"Find {keyword} in {ext} files",
                     risk_level="High",
@@ -515,7 +591,7 @@ class GoogleDorker:
                     example_target=target
                 ))
         
-        return advanced_queries[:15]  # Limit results
+        return advanced_queries[:_ADVANCED_QUERY_LIMIT]  # Limit results
     
     def generate_osint_queries(self, target: str) -> List[DorkQuery]:
         """Generate OSINT-focused dork queries"""
@@ -558,34 +634,48 @@ class GoogleDorker:
     
     def display_queries(self, queries: List[DorkQuery], show_warnings: bool = True):
         """Display generated queries in a formatted way"""
+        # Collect every line and emit them with a single write
+        parts: List[str] = []
         if show_warnings:
-            print("\n".join(self.ethical_warnings))
-            print("\n" + "="*80 + "\n")
+            parts.extend(self.ethical_warnings)
+            parts.extend(("", "="*80, ""))
         
         for i, dork in enumerate(queries, 1):
-            print(f"[{i}] {dork.category.value.upper()}")
-            print(f"Query: {dork.query}")
-            print(f"Description: {dork.description}")
-            print(f"Risk Level: {dork.risk_level}")
-            print(f"Use Case: {dork.use_case}")
-            print(f"Google URL: https://www.google.com/search?q={urllib.parse.quote(dork.query)}")
-            print("-" * 80)
+            parts.append(_DISPLAY_TEMPLATE.format(
+                i, _CAT_UPPER[dork.category], dork.query, dork.description,
+                dork.risk_level, dork.use_case, _quote(dork.query)
+            ))
+        
+        if parts:
+            sys.stdout.write("\n".join(parts) + "\n")
     
     def save_queries(self, queries: List[DorkQuery], filename: str):
         """Save queries to a JSON file"""
-        data = []
-        for dork in queries:
-            data.append({
-                "query": dork.query,
-                "category": dork.category.value,
-                "description": dork.description,
-                "risk_level": dork.risk_level,
-                "use_case": dork.use_case,
-                "example_target": dork.example_target
-            })
+        try:
+            import orjson
+        except ImportError:  # Optional: fall back to the stdlib json encoder
+            orjson = None
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            # orjson serializes the dataclasses and enum values natively
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(list(queries), option=orjson.OPT_INDENT_2))
+        else:
+            import json
+            
+            data = []
+            for dork in queries:
+                data.append({
+                    "query": dork.query,
+                    "category": dork.category.value,
+                    "description": dork.description,
+                    "risk_level": dork.risk_level,
+                    "use_case": dork.use_case,
+                    "example_target": dork.example_target
+                })
+            
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"Queries saved to {filename}")
     
@@ -616,7 +706,7 @@ class GoogleDorker:
             
             if choice == "1":
                 count = int(input("Number of queries to generate (default 10): ") or "10")
-                queries = self.generate_dork_queries(target, count=count)
+                queries = list(self.generate_dork_queries(target, count=count))
                 self.display_queries(queries)
                 
             elif choice == "2":
@@ -636,9 +726,9 @@ class GoogleDorker:
                 
                 try:
                     cat_choice = int(input("Select category number: ")) - 1
-                    if 0 <= cat_choice < len(DorkCategory):
-                        selected_category = list(DorkCategory)[cat_choice]
-                        queries = self.generate_dork_queries(target, selected_category)
+                    if 0 <= cat_choice < len(_ALL_CATEGORIES):
+                        selected_category = _ALL_CATEGORIES[cat_choice]
+                        queries = list(self.generate_dork_queries(target, selected_category))
                         self.display_queries(queries)
                     else:
                         print("Invalid category selection.")
@@ -660,6 +750,8 @@ class GoogleDorker:
 
 def main():
     """Main function"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Google Dorker - Advanced Reconnaissance Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -701,13 +793,13 @@ Examples:
     elif args.category:
         try:
             category = DorkCategory(args.category)
-            queries = dorker.generate_dork_queries(args.target, category, args.count)
+            queries = list(dorker.generate_dork_queries(args.target, category, args.count))
         except ValueError:
             print(f"Error: Invalid category '{args.category}'")
             print("Available categories:", [c.value for c in DorkCategory])
             return
     else:
-        queries = dorker.generate_dork_queries(args.target, count=args.count)
+        queries = list(dorker.generate_dork_queries(args.target, count=args.count))
     
     dorker.display_queries(queries, not args.no_warnings)
     
@@ -15,68 +15,120 @@ Version: 1.0
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import font as tkfont
 import threading
+import queue
 import time
 import random
 import string
-import json
-from google_dorker import GoogleDorker, DorkCategory
-import urllib.parse
+from collections import deque
+from urllib.parse import quote as _urlquote
+
+# Search URL prefix for displayed queries
+_GOOGLE_Q = "https://www.google.com/search?q="
+
+# Results text tag for each risk level
+_RISK_TAG = {risk: f"risk_{risk.lower()}" for risk in ("Critical", "High", "Medium", "Low")}
 
 class MatrixRain:
     """Matrix-style falling code animation"""
     
+    # Horizontal spacing between columns
+    FONT_SIZE = 12
+    
     def __init__(self, canvas, width, height):
         self.canvas = canvas
         self.width = width
         self.height = height
         self.drops = []
         self.chars = "01アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン"
+        self._chars = tuple(self.chars)
+        # Trails are drawn as multi-line text, so rows are one line apart
+        self.font = tkfont.Font(root=canvas, family="Courier", size=10)
+        self.row_height = self.font.metrics("linespace")
         self.init_drops()
     
     def init_drops(self):
         """Initialize falling drops"""
-        font_size = 12
-        columns = self.width // font_size
+        columns = self.width // self.FONT_SIZE
         for i in range(columns):
-            self.drops.append({
-                'x': i * font_size,
-                'y': random.randint(-self.height, 0),
-                'speed': random.uniform(1, 3),
-                'chars': []
-            })
+            self.drops.append(self.create_drop(i))
+    
+    def create_drop(self, column):
+        """Create the drop and its canvas items for one column"""
+        x = column * self.FONT_SIZE
+        tag = f"matrix_col{column}"
+        drop = {
+            'x': x,
+            'y': random.randint(-self.height, 0),
+            'speed': random.uniform(1, 3),
+            'chars': deque(maxlen=15),  # Oldest characters drop off automatically
+            'tag': tag,
+            # The dim trail as one multi-line item, with the bright head on top
+            'body': self.canvas.create_text(x, 0, text='', fill="#004400", font=self.font,
+                                            anchor='n', justify='center', tags=("matrix", tag)),
+            'head': self.canvas.create_text(x, 0, text='', fill="#00ff00", font=self.font,
+                                            anchor='n', tags=("matrix", tag)),
+            # Set when the drop needs redrawing on the next frame
+            'dirty': True
+        }
+        self.place_drop(drop)
+        return drop
+    
+    def resize(self, width, height):
+        """Match the number of columns to a new canvas size"""
+        self.width = width
+        self.height = height
+        columns = width // self.FONT_SIZE
+        
+        # Drop columns that are now off-screen, or add the newly exposed ones
+        for drop in self.drops[columns:]:
+            self.canvas.delete(drop['tag'])
+        del self.drops[columns:]
+        for i in range(len(self.drops), columns):
+            self.drops.append(self.create_drop(i))
+    
+    def place_drop(self, drop):
+        """Position a drop's items at its current y"""
+        self.canvas.coords(drop['body'], drop['x'], drop['y'])
+        self.canvas.coords(drop['head'], drop['x'], drop['y'])
     
     def update(self):
         """Update animation frame"""
-        self.canvas.delete("matrix")
+        canvas = self.canvas
+        height = self.height
+        row_height = self.row_height
         
+        # Move every drop, noting the ones whose head reached a new row
+        dirty = []
         for drop in self.drops:
-            # Add new character
-            if len(drop['chars']) < 20:
-                drop['chars'].append(random.choice(self.chars))
-            
-            # Remove old characters
-            if len(drop['chars']) > 15:
-                drop['chars'].pop(0)
+            old_y = drop['y']
+            y = drop['y'] = old_y + drop['speed']
+            if y > height:
+                drop['y'] = random.randint(-200, 0)
+                drop['chars'].clear()
+                drop['dirty'] = True
+                self.place_drop(drop)
+            else:
+                # One canvas call shifts both of the drop's items
+                canvas.move(drop['tag'], 0, drop['speed'])
             
-            # Draw characters
-            for i, char in enumerate(drop['chars']):
-                y = drop['y'] + (i * 20)
-                if 0 <= y <= self.height:
-                    color = "#00ff00" if i == len(drop['chars']) - 1 else "#004400"
-                    self.canvas.create_text(
-                        drop['x'], y, 
-                        text=char, 
-                        fill=color, 
-                        font=("Courier", 10),
-                        tags="matrix"
-                    )
+            if drop['dirty'] or y // row_height != old_y // row_height:
+                dirty.append(drop)
+        
+        # Draw the new characters in one batch, one per dirty drop
+        new_chars = random.choices(self._chars, k=len(dirty))
+        
+        for drop, new_char in zip(dirty, new_chars):
+            drop['dirty'] = False
+            chars = drop['chars']
             
-            # Move drop
-            drop['y'] += drop['speed']
-            if drop['y'] > self.height:
-                drop['y'] = random.randint(-200, 0)
-                drop['chars'] = []
+            # Add new character; the previous head joins the dim trail
+            chars.append(new_char)
+            head = len(chars) - 1
+            canvas.itemconfigure(drop['body'], text="\n".join(list(chars)[:head]))
+            canvas.itemconfigure(drop['head'], text=new_char)
+            canvas.coords(drop['head'], drop['x'], drop['y'] + head * row_height)
 
 class HackerTerminal:
     """Main GUI class with hacker aesthetic"""
@@ -92,16 +144,44 @@ class HackerTerminal:
         self.style.theme_use('clam')
         self.configure_styles()
         
-        # Initialize Google Dorker
-        self.dorker = GoogleDorker()
+        # Google Dorker is loaded once the window is up, see _load_dorker
+        self.dorker = None
+        self.category_by_value = {}
+        self.category_label = {}
         self.current_queries = []
         
         # Animation control
         self.animation_running = False
-        self.animation_thread = None
+        self._after_id = None
+        self._frame_ms = 100  # Target time between animation frames
+        self._skip_frame = False
+        
+        # Long-lived worker thread that runs generation jobs off the UI thread
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._job_loop, daemon=True)
+        self._worker.start()
         
         self.create_widgets()
         self.start_animation()
+        self.root.after(0, self._load_dorker)
+        
+        # Pause the animation while none of it can be seen
+        self.root.bind('<Unmap>', self._on_root_unmap)
+        self.root.bind('<Map>', self._on_root_map)
+        self.matrix_canvas.bind('<Visibility>', self._on_matrix_visibility)
+    
+    def _load_dorker(self):
+        """Import the dork catalog after the window has been drawn"""
+        self.root.update_idletasks()
+        from google_dorker import GoogleDorker, DorkCategory
+        
+        self.dorker = GoogleDorker()
+        self.category_by_value = {cat.value: cat for cat in DorkCategory}
+        self.category_label = {cat: cat.value.upper() for cat in DorkCategory}
+        self.category_combo['values'] = ('all',) + tuple(self.category_by_value)
+        self.generate_btn.config(state='normal')
+        self.advanced_btn.config(state='normal')
+        self.update_status("READY - Enter target and generate dorks")
         
     def configure_styles(self):
         """Configure hacker-style colors"""
@@ -184,7 +264,7 @@ class HackerTerminal:
                                           style='Hacker.TCombobox',
                                           width=20,
                                           state='readonly')
-        self.category_combo['values'] = ['all'] + [cat.value for cat in DorkCategory]
+        self.category_combo['values'] = ['all']
         self.category_combo.pack(side=tk.LEFT, padx=(10, 0))
         
         # Query count
@@ -204,7 +284,8 @@ class HackerTerminal:
         self.generate_btn = ttk.Button(button_frame, 
                                       text="GENERATE DORKS",
                                       style='Hacker.TButton',
-                                      command=self.generate_dorks)
+                                      command=self.generate_dorks,
+                                      state='disabled')
         self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.clear_btn = ttk.Button(button_frame,
@@ -222,7 +303,8 @@ class HackerTerminal:
         self.advanced_btn = ttk.Button(button_frame,
                                       text="ADVANCED",
                                       style='Hacker.TButton',
-                                      command=self.show_advanced)
+                                      command=self.show_advanced,
+                                      state='disabled')
         self.advanced_btn.pack(side=tk.LEFT)
     
     def create_results_area(self, parent):
@@ -240,7 +322,8 @@ class HackerTerminal:
             selectbackground='#004400',
             selectforeground='#00ff00',
             wrap=tk.WORD,
-            height=20
+            height=20,
+            undo=False
         )
         self.results_text.pack(fill=tk.BOTH, expand=True)
         
@@ -261,13 +344,14 @@ class HackerTerminal:
         self.status_frame.pack(fill=tk.X, pady=(0, 5))
         
         self.status_label = ttk.Label(self.status_frame, 
-                                     text="READY - Enter target and generate dorks",
+                                     text="LOADING...",
                                      style='Hacker.TLabel')
         self.status_label.pack(side=tk.LEFT)
         
         # Progress bar
         self.progress = ttk.Progressbar(self.status_frame, 
-                                       mode='indeterminate',
+                                       mode='determinate',
+                                       maximum=100,
                                        length=200)
         self.progress.pack(side=tk.RIGHT)
     
@@ -279,26 +363,80 @@ class HackerTerminal:
                                       highlightthickness=0)
         self.matrix_canvas.pack(fill=tk.X, pady=(5, 0))
         self.matrix_rain = MatrixRain(self.matrix_canvas, 1200, 100)
+        
+        # Follow the canvas size, applying a burst of resize events once
+        self._matrix_size = None
+        self._resize_id = None
+        self.matrix_canvas.bind('<Configure>', self._on_matrix_configure)
+    
+    def _on_matrix_configure(self, event):
+        """Queue a resize of the animation to the new canvas size"""
+        self._matrix_size = (event.width, event.height)
+        if self._resize_id is None:
+            self._resize_id = self.root.after_idle(self._apply_matrix_resize)
+    
+    def _apply_matrix_resize(self):
+        """Resize the animation to the latest canvas size"""
+        self._resize_id = None
+        self.matrix_rain.resize(*self._matrix_size)
     
     def start_animation(self):
         """Start the matrix animation"""
         self.animation_running = True
-        self.animation_thread = threading.Thread(target=self.animate, daemon=True)
-        self.animation_thread.start()
+        self._tick()
     
-    def animate(self):
-        """Animation loop"""
-        while self.animation_running:
-            try:
-                self.matrix_rain.update()
-                time.sleep(0.1)
-            except:
-                break
+    def _tick(self):
+        """Draw one animation frame and schedule the next on the Tk event loop"""
+        if not self.animation_running:
+            return
+        
+        if self._skip_frame:
+            # The last frame overran badly, so let the event loop catch up
+            self._skip_frame = False
+            elapsed_ms = 0
+        else:
+            start = time.perf_counter()
+            self.matrix_rain.update()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._skip_frame = elapsed_ms > 2 * self._frame_ms
+        
+        # Count the drawing time against the frame budget
+        delay = max(1, int(self._frame_ms - elapsed_ms))
+        self._after_id = self.root.after(delay, self._tick)
+    
+    def stop_animation(self):
+        """Stop the matrix animation and cancel the pending frame"""
+        self.animation_running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _resume_animation(self):
+        """Restart the animation if it is paused"""
+        if not self.animation_running:
+            self.start_animation()
+    
+    def _on_root_unmap(self, event):
+        """Pause when the main window is iconified"""
+        # Child widgets inherit the root's bindings, so ignore their events
+        if event.widget is self.root:
+            self.stop_animation()
+    
+    def _on_root_map(self, event):
+        """Resume when the main window is restored"""
+        if event.widget is self.root:
+            self._resume_animation()
+    
+    def _on_matrix_visibility(self, event):
+        """Pause while the animation canvas is fully covered"""
+        if event.state == 'VisibilityFullyObscured':
+            self.stop_animation()
+        else:
+            self._resume_animation()
     
     def update_status(self, message):
         """Update status bar"""
         self.status_label.config(text=message)
-        self.root.update_idletasks()
     
     def generate_dorks(self):
         """Generate dork queries"""
@@ -311,9 +449,8 @@ class HackerTerminal:
         category_str = self.category_var.get()
         category = None
         if category_str != "all":
-            try:
-                category = DorkCategory(category_str)
-            except ValueError:
+            category = self.category_by_value.get(category_str)
+            if category is None:
                 messagebox.showerror("Error", f"Invalid category: {category_str}")
                 return
         
@@ -323,23 +460,29 @@ class HackerTerminal:
         except ValueError:
             count = 10
         
-        # Start generation in thread
+        # Hand the job to the worker thread
         self.generate_btn.config(state='disabled')
-        self.progress.start()
+        self.progress.configure(value=0)
         self.update_status("GENERATING DORKS...")
         
-        thread = threading.Thread(target=self._generate_dorks_thread, 
-                                 args=(target, category, count), daemon=True)
-        thread.start()
+        self._jobs.put((target, category, count))
+    
+    def _job_loop(self):
+        """Worker loop: run queued generation jobs one at a time"""
+        while True:
+            target, category, count = self._jobs.get()
+            self._generate_dorks_thread(target, category, count)
     
     def _generate_dorks_thread(self, target, category, count):
         """Generate dorks in background thread"""
         try:
-            # Generate queries
-            if category:
-                queries = self.dorker.generate_dork_queries(target, category, count)
-            else:
-                queries = self.dorker.generate_dork_queries(target, count=count)
+            # Generate queries, reporting progress about every tenth of the way
+            queries = []
+            step = max(1, count // 10)
+            for dork in self.dorker.generate_dork_queries(target, category, count):
+                queries.append(dork)
+                if len(queries) % step == 0:
+                    self.root.after(0, self.progress.configure, {'value': 100 * len(queries) / count})
             
             self.current_queries = queries
             
@@ -353,51 +496,49 @@ class HackerTerminal:
         """Display results in the text area"""
         self.results_text.delete(1.0, tk.END)
         
-        # Add header
-        self.results_text.insert(tk.END, "GOOGLE DORKER RESULTS\n", "header")
-        self.results_text.insert(tk.END, "=" * 50 + "\n\n", "separator")
-        
-        # Add ethical warning
-        self.results_text.insert(tk.END, "WARNING: Authorized use only!\n", "risk_critical")
-        self.results_text.insert(tk.END, "=" * 50 + "\n\n", "separator")
+        # Collect alternating text/tag arguments for a single insert call
+        parts = [
+            # Header
+            "GOOGLE DORKER RESULTS\n", "header",
+            "=" * 50 + "\n\n", "separator",
+            
+            # Ethical warning
+            "WARNING: Authorized use only!\n", "risk_critical",
+            "=" * 50 + "\n\n", "separator"
+        ]
         
         # Add queries
+        extend = parts.extend
+        quote = _urlquote
+        category_label = self.category_label
+        separator = "-" * 80 + "\n"
         for i, dork in enumerate(queries, 1):
-            # Header
-            self.results_text.insert(tk.END, f"[{i}] {dork.category.value.upper()}\n", "header")
-            
-            # Query
-            self.results_text.insert(tk.END, f"Query: {dork.query}\n", "query")
-            
-            # Description
-            self.results_text.insert(tk.END, f"Description: {dork.description}\n", "description")
-            
-            # Risk level
-            risk_tag = f"risk_{dork.risk_level.lower()}"
-            self.results_text.insert(tk.END, f"Risk Level: {dork.risk_level}\n", risk_tag)
-            
-            # Use case
-            self.results_text.insert(tk.END, f"Use Case: {dork.use_case}\n", "description")
-            
-            # Google URL
-            google_url = f"https://www.google.com/search?q={urllib.parse.quote(dork.query)}"
-            self.results_text.insert(tk.END, f"Google URL: {google_url}\n", "url")
-            
-            # Separator
-            self.results_text.insert(tk.END, "-" * 80 + "\n", "separator")
+            risk_tag = _RISK_TAG.get(dork.risk_level, "risk_low")
+            google_url = _GOOGLE_Q + quote(dork.query)
+            extend((
+                f"[{i}] {category_label[dork.category]}\n", "header",
+                f"Query: {dork.query}\n", "query",
+                f"Description: {dork.description}\n", "description",
+                f"Risk Level: {dork.risk_level}\n", risk_tag,
+                f"Use Case: {dork.use_case}\n", "description",
+                f"Google URL: {google_url}\n", "url",
+                separator, "separator"
+            ))
+        
+        self.results_text.insert(tk.END, *parts)
         
         # Update status
         self.update_status(f"GENERATED {len(queries)} DORK QUERIES")
         
         # Re-enable button
         self.generate_btn.config(state='normal')
-        self.progress.stop()
+        self.progress.configure(value=100)
     
     def _show_error(self, error_msg):
         """Show error message"""
         self.update_status(f"ERROR: {error_msg}")
         self.generate_btn.config(state='normal')
-        self.progress.stop()
+        self.progress.configure(value=0)
         messagebox.showerror("Error", error_msg)
     
     def clear_results(self):
@@ -432,7 +573,7 @@ class HackerTerminal:
     
     def on_closing(self):
         """Handle window closing"""
-        self.animation_running = False
+        self.stop_animation()
         self.root.destroy()
 
 class AdvancedDialog:
@@ -540,13 +681,13 @@ class AdvancedDialog:
     def display_queries(self, queries, title):
         """Display queries in results area"""
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"{title}\n", "header")
-        self.results_text.insert(tk.END, "=" * 50 + "\n\n")
         
+        # Build the whole listing and insert it with a single call
+        parts = [f"{title}\n", "=" * 50 + "\n\n"]
         for i, dork in enumerate(queries, 1):
-            self.results_text.insert(tk.END, f"[{i}] {dork.query}\n")
-            self.results_text.insert(tk.END, f"    {dork.description}\n")
-            self.results_text.insert(tk.END, f"    Risk: {dork.risk_level}\n\n")
+            parts.append(f"[{i}] {dork.query}\n    {dork.description}\n    Risk: {dork.risk_level}\n\n")
+        
+        self.results_text.insert(tk.END, "".join(parts))
 
 def main():
     """Main function"""